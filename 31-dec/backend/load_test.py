@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Load test for the warehouse API: starts main.py under uvicorn and replays a mix of
+create/get/validate requests with an async HTTP client.
+
+Install the extra dependencies with: pip install -r requirements-bench.txt
+
+Example:
+    python load_test.py --requests 2000 --concurrency 50 --mix create=1,get=4,validate=2
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import psutil
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (floors, rows, aisles, deep, pallets per side) for each request size
+SIZES = {
+    "small": (1, 2, 1, 1, 2),
+    "medium": (3, 5, 2, 2, 20),
+    "large": (5, 10, 4, 2, 100),
+}
+
+
+def parse_weights(text):
+    weights = {}
+    for part in text.split(","):
+        name, _, value = part.partition("=")
+        weights[name.strip()] = float(value) if value else 1.0
+    return weights
+
+
+def make_side_config(floors, rows, aisles, deep):
+    return {
+        "num_floors": floors,
+        "num_rows": rows,
+        "num_aisles": aisles,
+        "deep": deep,
+        "aisle_gaps": [50] * (aisles - 1),
+        "deep_gaps": [20] * (deep - 1),
+        "gap_front": 100,
+        "gap_back": 100,
+        "gap_left": 50,
+        "gap_right": 50,
+        "wall_gap_unit": "cm"
+    }
+
+
+def make_config(warehouse_id, size, rng):
+    floors, rows, aisles, deep, num_pallets = SIZES[size]
+
+    pallets = []
+    for side in ("left", "right"):
+        for _ in range(num_pallets):
+            pallets.append({
+                "type": "wooden",
+                "weight": 500,
+                "length_cm": 120,
+                "width_cm": 80,
+                "height_cm": 150,
+                "position": {
+                    "floor": rng.randint(1, floors),
+                    "row": rng.randint(1, rows),
+                    "col": rng.randint(1, aisles * deep),
+                    "depth": rng.randint(1, deep),
+                    "side": side
+                }
+            })
+
+    return {
+        "id": warehouse_id,
+        "warehouse_dimensions": {
+            "length": 5000,
+            "width": 8000,
+            "height": 1500,
+            "height_safety_margin": 200,
+            "unit": "cm"
+        },
+        "num_workstations": 2,
+        "workstation_gap": 200,
+        "workstation_gap_unit": "cm",
+        "workstation_configs": [
+            {
+                "workstation_index": i,
+                "aisle_space": 400,
+                "aisle_space_unit": "cm",
+                "left_side_config": make_side_config(floors, rows, aisles, deep),
+                "right_side_config": make_side_config(floors, rows, aisles, deep),
+                "pallet_configs": pallets
+            }
+            for i in range(2)
+        ]
+    }
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def pick_port(host, port):
+    """Return a free port: the requested one if nothing listens on it, or an ephemeral one for 0"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind((host, port))
+        except OSError:
+            raise RuntimeError(f"Port {port} is already in use on {host}")
+        return sock.getsockname()[1]
+
+
+def start_server(host, port):
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app",
+         "--host", host, "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        # main.py prints every created config; keep it out of the report
+        stdout=subprocess.DEVNULL,
+    )
+
+
+async def wait_for_server(client, proc, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited with code {proc.returncode}")
+        try:
+            await client.get("/openapi.json")
+            # Make sure the answer came from our server and not one already on the port
+            await asyncio.sleep(0.2)
+            if proc.poll() is not None:
+                raise RuntimeError(f"Server exited with code {proc.returncode}")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Server did not start in time")
+
+
+async def sample_rss(process, samples, interval):
+    while True:
+        try:
+            rss = process.memory_info().rss
+            for child in process.children(recursive=True):
+                rss += child.memory_info().rss
+            samples.append(rss)
+        except psutil.NoSuchProcess:
+            return
+        await asyncio.sleep(interval)
+
+
+async def run_load(args):
+    rng = random.Random(args.seed)
+    weights = parse_weights(args.mix)
+    sizes = [s.strip() for s in args.sizes.split(",")]
+    for op in weights:
+        if op not in ("create", "get", "validate"):
+            raise ValueError(f"Unknown operation in mix: {op}")
+    for size in sizes:
+        if size not in SIZES:
+            raise ValueError(f"Unknown request size: {size}")
+
+    ops = list(weights)
+    op_weights = [weights[op] for op in ops]
+
+    # Pre-build one payload per size so request generation stays out of the timings
+    payloads = {size: make_config(f"load-{size}", size, rng) for size in sizes}
+    created_ids = {size: [f"load-{size}"] for size in sizes}
+    id_counter = itertools.count()
+
+    port = pick_port(args.host, args.port)
+    proc = start_server(args.host, port)
+    server = psutil.Process(proc.pid)
+    rss_samples = []
+    results = []
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    base_url = f"http://{args.host}:{port}"
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+            await wait_for_server(client, proc)
+            for size in sizes:
+                response = await client.post("/api/warehouse/create", json=payloads[size])
+                if response.status_code >= 400:
+                    raise RuntimeError(f"Warm-up create for '{size}' failed: {response.status_code} {response.text}")
+
+            sampler = asyncio.create_task(sample_rss(server, rss_samples, args.rss_interval))
+            baseline_rss = server.memory_info().rss
+            remaining = [args.requests]
+
+            async def worker():
+                while remaining[0] > 0:
+                    remaining[0] -= 1
+                    op = rng.choices(ops, op_weights)[0]
+                    size = rng.choice(sizes)
+
+                    if op == "create":
+                        warehouse_id = f"load-{size}-{next(id_counter)}"
+                        body = dict(payloads[size], id=warehouse_id)
+                        request = client.post("/api/warehouse/create", json=body)
+                    elif op == "validate":
+                        request = client.post("/api/warehouse/validate", json=payloads[size])
+                    else:
+                        request = client.get(f"/api/warehouse/{rng.choice(created_ids[size])}")
+
+                    start = time.perf_counter()
+                    try:
+                        response = await request
+                        ok = response.status_code < 400
+                        if op == "validate":
+                            ok = ok and response.json().get("valid", False)
+                    except httpx.HTTPError:
+                        ok = False
+                    elapsed = time.perf_counter() - start
+
+                    if op == "create" and ok:
+                        created_ids[size].append(warehouse_id)
+                    results.append((op, size, elapsed, ok))
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            wall_time = time.perf_counter() - started
+
+            sampler.cancel()
+            final_rss = server.memory_info().rss
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+    return build_report(results, wall_time, baseline_rss, final_rss, rss_samples)
+
+
+def summarize(entries, wall_time):
+    latencies = sorted(e[2] * 1000 for e in entries)
+    errors = sum(1 for e in entries if not e[3])
+    return {
+        "requests": len(entries),
+        "errors": errors,
+        "error_rate": errors / len(entries) if entries else 0.0,
+        "throughput_rps": len(entries) / wall_time if wall_time > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+def build_report(results, wall_time, baseline_rss, final_rss, rss_samples):
+    groups = {}
+    for entry in results:
+        groups.setdefault(f"{entry[0]}/{entry[1]}", []).append(entry)
+
+    return {
+        "wall_time_s": wall_time,
+        "overall": summarize(results, wall_time),
+        "by_operation": {key: summarize(groups[key], wall_time) for key in sorted(groups)},
+        "server_rss_mb": {
+            "baseline": baseline_rss / 2**20,
+            "peak": max(rss_samples + [final_rss]) / 2**20,
+            "final": final_rss / 2**20,
+        }
+    }
+
+
+def print_report(report):
+    print("\n" + "="*78)
+    print(f" LOAD TEST RESULTS ({report['wall_time_s']:.2f}s)")
+    print("="*78)
+    header = f"{'operation':<20}{'reqs':>7}{'err%':>8}{'req/s':>10}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}"
+    print(header)
+    print("-"*78)
+    rows = list(report['by_operation'].items()) + [("TOTAL", report['overall'])]
+    for name, s in rows:
+        print(f"{name:<20}{s['requests']:>7}{s['error_rate'] * 100:>7.1f}%{s['throughput_rps']:>10.1f}"
+              f"{s['p50_ms']:>11.2f}{s['p95_ms']:>11.2f}{s['p99_ms']:>11.2f}")
+    rss = report['server_rss_mb']
+    print("-"*78)
+    print(f"Server RSS: baseline {rss['baseline']:.1f} MB, peak {rss['peak']:.1f} MB, final {rss['final']:.1f} MB")
+    print("="*78 + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for the warehouse API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="Server port (0 picks a free one)")
+    parser.add_argument("--requests", type=int, default=1000, help="Total requests to send")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent in-flight requests")
+    parser.add_argument("--mix", default="create=1,get=4,validate=2", help="Weighted operation mix")
+    parser.add_argument("--sizes", default="small,medium,large", help="Request sizes to draw from")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--rss-interval", type=float, default=0.2, help="Server RSS sampling interval in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ app.add_middleware(
 )
 
 warehouse_data = {}
+travel_cost_data = {}
 
 class Dimensions(BaseModel):
     length: float
@@ -70,13 +71,18 @@ class WarehouseConfig(BaseModel):
     workstation_gap_unit: str = "cm"
     workstation_configs: List[WorkstationConfig]
 
+class TravelCostQuery(BaseModel):
+    slot_ids: List[str]
+
 @app.post("/api/warehouse/create")
 async def create_warehouse(config: WarehouseConfig):
     try:
         calc = WarehouseCalculator()
         config_dict = config.model_dump()
         layout = calc.create_warehouse_layout(config_dict)
+        travel_costs = calc.build_travel_cost_index(layout)
         warehouse_data[config.id] = {"config": config_dict, "layout": layout}
+        travel_cost_data[config.id] = travel_costs
         
         print("\n" + "="*50)
         print(f" NEW WAREHOUSE CREATED: {config.id}")
@@ -105,11 +111,20 @@ async def get_warehouse(warehouse_id: str):
         raise HTTPException(status_code=404, detail="Warehouse not found")
     return {"success": True, "warehouse": warehouse_data[warehouse_id]}
 
+@app.post("/api/warehouse/{warehouse_id}/travel-costs")
+async def get_travel_costs(warehouse_id: str, query: TravelCostQuery):
+    if warehouse_id not in travel_cost_data:
+        raise HTTPException(status_code=404, detail="Warehouse not found")
+    calc = WarehouseCalculator()
+    result = calc.query_travel_costs(travel_cost_data[warehouse_id], query.slot_ids)
+    return {"success": True, **result}
+
 @app.delete("/api/warehouse/{warehouse_id}/delete")
 async def delete_warehouse(warehouse_id: str):
     if warehouse_id in warehouse_data:
         deleted_config = warehouse_data[warehouse_id]["config"]
         del warehouse_data[warehouse_id]
+        travel_cost_data.pop(warehouse_id, None)
         
         print("\n" + "!"*50)
         print(f" WAREHOUSE DELETED: {warehouse_id}")
@@ -235,11 +235,106 @@ def test_single_aisle_deep():
         traceback.print_exc()
         return False
 
+def test_travel_costs():
+    """Test precomputed travel costs from the central aisle to storage slots"""
+    
+    calc = WarehouseCalculator()
+    
+    config = {
+        "id": "test-travel-costs",
+        "warehouse_dimensions": {
+            "length": 2000,
+            "width": 4000,
+            "height": 1000,
+            "height_safety_margin": 200,
+            "unit": "cm"
+        },
+        "num_workstations": 1,
+        "workstation_gap": 0,
+        "workstation_gap_unit": "cm",
+        "workstation_configs": [
+            {
+                "workstation_index": 0,
+                "aisle_space": 400,
+                "aisle_space_unit": "cm",
+                "left_side_config": {
+                    "num_floors": 2,
+                    "num_rows": 2,
+                    "num_aisles": 1,
+                    "deep": 2,
+                    "aisle_gaps": [],
+                    "deep_gaps": [50],
+                    "gap_front": 100,
+                    "gap_back": 100,
+                    "gap_left": 100,
+                    "gap_right": 100,
+                    "wall_gap_unit": "cm"
+                },
+                "right_side_config": {
+                    "num_floors": 1,
+                    "num_rows": 1,
+                    "num_aisles": 1,
+                    "deep": 1,
+                    "aisle_gaps": [],
+                    "deep_gaps": [],
+                    "gap_front": 100,
+                    "gap_back": 100,
+                    "gap_left": 100,
+                    "gap_right": 100,
+                    "wall_gap_unit": "cm"
+                },
+                "pallet_configs": []
+            }
+        ]
+    }
+    
+    try:
+        print("\n" + "="*60)
+        print("Testing travel cost index...")
+        layout = calc.create_warehouse_layout(config)
+        index = calc.build_travel_cost_index(layout)
+    
+        # Left: 2 rows * 2 deep * 2 floors, right: 1 slot
+        assert len(index['slot_ids']) == 9
+    
+        # Side width 1800, available width 1600, slot width (1600 - 50) / 2 = 775
+        # Row length (2000 - 200) / 2 = 900, floor height 800 / 2 = 400
+        result = calc.query_travel_costs(index, [
+            "aisle-0-left-1-1-1",
+            "aisle-0-left-0-2-0",
+            "aisle-0-right-0-1-0",
+            "no-such-slot"
+        ])
+        costs = {c['slot_id']: c for c in result['costs']}
+    
+        far = costs["aisle-0-left-1-1-1"]
+        assert far['walk'] == (100 + 900 + 450) + (1800 - (100 + 387.5))
+        assert far['lift'] == 400
+        assert far['total'] == far['walk'] + far['lift']
+    
+        near = costs["aisle-0-left-0-2-0"]
+        assert near['walk'] == (100 + 450) + (1800 - (100 + 775 + 50 + 387.5))
+        assert near['lift'] == 0
+    
+        right = costs["aisle-0-right-0-1-0"]
+        assert right['walk'] == (100 + 900) + (100 + 800)
+    
+        assert result['missing'] == ["no-such-slot"]
+        print("✅ Travel costs match layout geometry")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 if __name__ == "__main__":
     success1 = test_aisle_labeling()
     success2 = test_single_aisle_deep()
+    success3 = test_travel_costs()
     
-    if success1 and success2:
+    if success1 and success2 and success3:
         print("\n🎉 All labeling tests passed!")
     else:
         print("\n💥 Some tests failed!")
\ No newline at end of file
@@ -271,6 +271,73 @@ class WarehouseCalculator:
 
         return aisles
 
+    def build_travel_cost_index(self, layout):
+        """Precompute walking and lift distance from each central aisle to every storage slot"""
+        slot_ids = []
+        walk = []
+        lift = []
+        total = []
+
+        for i, ws in enumerate(layout['workstations']):
+            central = next(a for a in ws['aisles'] if a['id'] == f"central-aisle-{i}")
+            central_left = central['position']['x']
+            central_right = central_left + central['dimensions']['width']
+
+            for aisle in ws['aisles']:
+                if aisle['type'] != 'storage_aisle':
+                    continue
+
+                pos = aisle['position']
+                dims = aisle['dimensions']
+
+                # Slot centre on the floor plane; positions already include wall, aisle and deep gaps
+                cx = pos['x'] + dims['width'] / 2
+                cy = pos['y'] + dims['length'] / 2
+
+                if aisle['side'] == 'left':
+                    lateral = central_left - cx
+                else:
+                    lateral = cx - central_right
+
+                w = cy + lateral
+                l = pos['z']  # Floor base height (floor index * floor height)
+
+                slot_ids.append(aisle['id'])
+                walk.append(w)
+                lift.append(l)
+                total.append(w + l)
+
+        return {
+            "slot_ids": slot_ids,
+            "index": {slot_id: k for k, slot_id in enumerate(slot_ids)},
+            "walk": walk,
+            "lift": lift,
+            "total": total
+        }
+
+    def query_travel_costs(self, index, slot_ids):
+        """Look up cached travel costs for a batch of slot ids"""
+        lookup = index['index']
+        walk = index['walk']
+        lift = index['lift']
+        total = index['total']
+
+        costs = []
+        missing = []
+        for slot_id in slot_ids:
+            k = lookup.get(slot_id)
+            if k is None:
+                missing.append(slot_id)
+                continue
+            costs.append({
+                "slot_id": slot_id,
+                "walk": walk[k],
+                "lift": lift[k],
+                "total": total[k]
+            })
+
+        return {"costs": costs, "missing": missing}
+
     def _assign_pallets(self, pallets, aisles):
         for i, p in enumerate(pallets):
             pos = p.get('position', {})